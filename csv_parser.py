@@ -1,8 +1,241 @@
 import csv
+import logging
 import os
-from typing import Dict, List
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, Iterator, List, Optional, Tuple
 
-def extract_units_from_csv(csv_path: str) -> List[Dict]:
+
+class _KeepCharsTable(dict):
+    """
+    str.translate table that keeps the given characters and deletes all others.
+    """
+
+    def __init__(self, keep: str):
+        super().__init__((ord(char), ord(char)) for char in keep)
+
+    def __missing__(self, key: int):
+        # Remember the deletion, so later lookups of this character never leave C
+        self[key] = None
+        return None
+
+
+log = logging.getLogger(__name__)
+
+# Deletes everything that is not part of a plain decimal number
+_NUM_TABLE = _KeepCharsTable('0123456789.')
+# Matches what _NUM_TABLE deletes, but keeps the newlines used to join a whole column together.
+# On long joined columns a regex substitution beats translate; on single values translate wins.
+_COLUMN_NUM_RE = re.compile(r'[^0-9.\n]+')
+
+# Characters that can start a bedroom count in the Typology column
+_DIGITS = frozenset('0123456789')
+
+# Number of rows cleaned together when streaming through a CSV file
+_BATCH_SIZE = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class Unit:
+    """
+    A single available unit as extracted from the CSV file.
+
+    Text fields are kept as they appear in the CSV. The calculated fields are
+    plain numbers (0 when they can't be calculated) and are only formatted
+    for the units that end up in the PDF.
+    """
+    unit_id: str
+    floor: str
+    bedrooms: str
+    internal_area: str
+    total_covered: str
+    asking_price: str
+    tax_type: str
+    tax_value: str
+    total_cost: float
+    price_per_m2: float
+    rental_rate: str
+    roi: float
+
+    def get(self, key: str, default=None):
+        """
+        Dictionary-style access, so units can be rendered the same way as the dict units from pdfworker.
+        """
+        return getattr(self, key, default)
+
+
+def _to_float(value: str) -> Optional[float]:
+    """
+    Convert a formatted number (e.g. "€250,000") to a float, returning None when it is empty or can't be parsed.
+    """
+    try:
+        return float(value.translate(_NUM_TABLE))
+    except ValueError:
+        return None
+
+
+def _columns_to_floats(*columns: List[str]) -> List[List[Optional[float]]]:
+    """
+    Convert equally long columns of formatted numbers to floats, cleaning all values of all columns with a single
+    regex pass. Values that are empty or can't be parsed become None.
+    """
+    values = list(chain.from_iterable(columns))
+    cleaned = _COLUMN_NUM_RE.sub('', '\n'.join(values)).split('\n')
+
+    if len(cleaned) != len(values):
+        # A value contained a newline of its own, clean the values one by one instead
+        floats = [_to_float(value) for value in values]
+    else:
+        try:
+            # Fast path: every cleaned value is either empty or a valid number
+            floats = [float(value) if value else None for value in cleaned]
+        except ValueError:
+            # Malformed values such as "1.2.3" are rare, so only then convert one by one
+            floats = [_to_float(value) for value in cleaned]
+
+    # Split the flat list back into one list per column
+    column_length = len(columns[0]) if columns else 0
+    return [floats[i * column_length:(i + 1) * column_length] for i in range(len(columns))]
+
+
+def _column(rows: List[List[str]], columns: Dict[str, int], name: str, missing: str = '') -> List[str]:
+    """
+    Extract one column from a batch of CSV rows, using `missing` for a column that isn't in the header
+    and '' for a short row.
+    """
+    index = columns.get(name)
+    if index is None:
+        return [missing] * len(rows)
+    return [row[index] if index < len(row) else '' for row in rows]
+
+
+def _units_from_rows(rows: List[List[str]], columns: Dict[str, int]) -> List[Unit]:
+    """
+    Build the units for a batch of CSV rows.
+
+    Args:
+        rows: Raw CSV rows
+        columns: Column index of each header name
+    """
+    available_units = []
+
+    unit_ids = _column(rows, columns, 'Unit ID')
+    floors = _column(rows, columns, 'Floor')
+    typologies = _column(rows, columns, 'Typology')
+    internal_areas = _column(rows, columns, 'Internal Area')
+    total_covered_strs = _column(rows, columns, 'Total Covered Area')
+    asking_price_strs = _column(rows, columns, 'Asking Price')
+    rental_rates = _column(rows, columns, 'Rental Rate')
+
+    # Extract the raw numeric columns and clean all of them in one pass
+    vat_strs = [value.strip() for value in _column(rows, columns, 'VAT')]
+    transfer_fee_strs = [value.strip() for value in _column(rows, columns, 'Transfer Fee')]
+
+    vat_values, transfer_fee_values, asking_prices, total_covered_values, rental_values = _columns_to_floats(
+        vat_strs,
+        transfer_fee_strs,
+        # A missing price or area column counts as 0, a missing or malformed value means it is unknown
+        _column(rows, columns, 'Asking Price', '0'),
+        _column(rows, columns, 'Total Covered Area', '0'),
+        rental_rates,
+    )
+
+    # Process each row
+    for i in range(len(rows)):
+        # Parse bedroom count from typology (e.g., "2 bedrooms" -> 2)
+        bedroom_count = ''
+        typology = typologies[i]
+        if typology and typology[0] in _DIGITS:
+            bedroom_count = typology[0]
+
+        # Determine which tax to display based on non-zero value
+        # Priority: VAT first if both have values
+        if vat_values[i] is not None and vat_values[i] > 0:
+            tax_type = "VAT"
+            tax_value = vat_strs[i]
+            tax_amount = vat_values[i]
+        elif transfer_fee_values[i] is not None and transfer_fee_values[i] > 0:
+            tax_type = "Transfer Fee"
+            tax_value = transfer_fee_strs[i]
+            tax_amount = transfer_fee_values[i]
+        else:
+            tax_type = ""
+            tax_value = ""
+            tax_amount = 0
+
+        asking_price = asking_prices[i]
+        total_covered = total_covered_values[i]
+        rental_value = rental_values[i]
+
+        if asking_price is None or total_covered is None or (rental_rates[i] and rental_value is None):
+            # Without a valid price and area, or with a malformed rental rate, nothing can be calculated
+            price_per_m2 = 0
+            total_cost = 0
+            roi = 0
+        else:
+            # Calculate price per square meter
+            price_per_m2 = asking_price / total_covered if total_covered > 0 else 0
+
+            # Calculate total cost (asking price + tax)
+            total_cost = asking_price + tax_amount
+
+            # Calculate ROI if rental rate is available
+            annual_rental = rental_value * 12 if rental_value is not None else 0
+            roi = (annual_rental / asking_price) * 100 if asking_price > 0 else 0
+
+        # Store the unit information
+        unit = Unit(
+            unit_id=unit_ids[i],
+            floor=floors[i],
+            bedrooms=bedroom_count,
+            internal_area=internal_areas[i],
+            total_covered=total_covered_strs[i],
+            asking_price=asking_price_strs[i],
+            tax_type=tax_type,
+            tax_value=tax_value,
+            total_cost=total_cost,
+            price_per_m2=price_per_m2,
+            rental_rate=rental_rates[i],
+            roi=roi
+        )
+
+        available_units.append(unit)
+
+    return available_units
+
+
+def iter_units_from_csv(csv_path: str, batch_size: int = _BATCH_SIZE) -> Iterator[Unit]:
+    """
+    Lazily yield unit information from a CSV file.
+
+    Rows are read and cleaned in batches of `batch_size`, so memory use stays
+    constant no matter how large the file is.
+    """
+    # Read the CSV file with utf-8-sig encoding to handle BOM character. newline='' hands line endings
+    # to the C csv reader directly instead of translating them in the io layer first.
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+
+        headers = next(reader, None)
+        if not headers:
+            raise ValueError("CSV file appears to be empty or has no headers")
+
+        # Resolve the column positions once, rows are then plain lists indexed by position
+        columns = {name: index for index, name in enumerate(headers)}
+
+        # Skip blank lines, like csv.DictReader does
+        rows_iter = filter(None, reader)
+
+        while True:
+            rows = list(islice(rows_iter, batch_size))
+            if not rows:
+                break
+            yield from _units_from_rows(rows, columns)
+
+
+def extract_units_from_csv(csv_path: str) -> List[Unit]:
     """
     Extract unit information from a CSV file.
 
@@ -22,111 +255,28 @@ def extract_units_from_csv(csv_path: str) -> List[Dict]:
     if not os.path.exists(csv_path):
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    available_units = []
-
     try:
-        # Read the CSV file with utf-8-sig encoding to handle BOM character
-        with open(csv_path, 'r', encoding='utf-8-sig') as csvfile:
-            reader = csv.DictReader(csvfile)
-
-            if not reader.fieldnames:
-                raise ValueError("CSV file appears to be empty or has no headers")
-
-            # Process each row
-            for row in reader:
-                # Parse bedroom count from typology (e.g., "2 bedrooms" -> 2)
-                bedroom_count = ''
-                typology = row.get('Typology', '')
-                if typology and len(typology) > 0 and typology[0].isdigit():
-                    bedroom_count = typology[0]
-
-                # Extract tax information (VAT and Transfer Fee)
-                vat_str = row.get('VAT', '').strip()
-                transfer_fee_str = row.get('Transfer Fee', '').strip()
-
-                # Clean and convert tax values to numeric for comparison
-                vat_value = 0
-                transfer_fee_value = 0
-
-                try:
-                    vat_value = float(''.join(c for c in vat_str if c.isdigit() or c == '.')) if vat_str else 0
-                except ValueError:
-                    vat_value = 0
-
-                try:
-                    transfer_fee_value = float(
-                        ''.join(c for c in transfer_fee_str if c.isdigit() or c == '.')) if transfer_fee_str else 0
-                except ValueError:
-                    transfer_fee_value = 0
-
-                # Determine which tax to display based on non-zero value
-                # Priority: VAT first if both have values
-                if vat_value > 0:
-                    tax_type = "VAT"
-                    tax_value = vat_str
-                    tax_amount = vat_value
-                elif transfer_fee_value > 0:
-                    tax_type = "Transfer Fee"
-                    tax_value = transfer_fee_str
-                    tax_amount = transfer_fee_value
-                else:
-                    tax_type = ""
-                    tax_value = ""
-                    tax_amount = 0
-
-                # Extract asking price and total covered area for calculations
-                asking_price_str = row.get('Asking Price', '0')
-                total_covered_str = row.get('Total Covered Area', '0')
-                rental_rate = row.get('Rental Rate', '')
-
-                # Calculate derived values
-                try:
-                    # Remove currency symbols and commas for calculation
-                    asking_price = float(''.join(c for c in asking_price_str if c.isdigit() or c == '.'))
-                    total_covered = float(''.join(c for c in total_covered_str if c.isdigit() or c == '.'))
-
-                    # Calculate price per square meter
-                    price_per_m2 = asking_price / total_covered if total_covered > 0 else 0
-
-                    # Calculate total cost (asking price + tax)
-                    total_cost = asking_price + tax_amount
-
-                    # Calculate ROI if rental rate is available
-                    roi = 0
-                    if rental_rate:
-                        annual_rental = float(''.join(c for c in rental_rate if c.isdigit() or c == '.')) * 12
-                        roi = (annual_rental / asking_price) * 100 if asking_price > 0 else 0
-
-                except (ValueError, ZeroDivisionError):
-                    price_per_m2 = 0
-                    total_cost = 0
-                    roi = 0
-
-                # Store the unit information
-                unit = {
-                    'unit_id': row.get('Unit ID', ''),
-                    'floor': row.get('Floor', ''),
-                    'bedrooms': bedroom_count,
-                    'internal_area': row.get('Internal Area', ''),
-                    'total_covered': row.get('Total Covered Area', ''),
-                    'asking_price': row.get('Asking Price', ''),
-                    'tax_type': tax_type,
-                    'tax_value': tax_value,
-                    'total_cost': f"{total_cost:,.0f}" if total_cost > 0 else '',
-                    'price_per_m2': f"{price_per_m2:,.0f}" if price_per_m2 > 0 else '',
-                    'rental_rate': rental_rate,
-                    'roi': f"{roi:.1f}%" if roi > 0 else ''
-                }
-
-                available_units.append(unit)
-
-        return available_units
+        return list(iter_units_from_csv(csv_path))
     except Exception as e:
-        print(f"Error parsing CSV file: {e}")
+        log.error("Error parsing CSV file: %s", e)
         return []
 
-def get_units_from_csv(csv_path: str) -> List[Dict]:
+@lru_cache(maxsize=32)
+def _cached_units_from_csv(csv_path: str, mtime_ns: int, size: int) -> Tuple[Unit, ...]:
+    """
+    Parse a CSV file once per (path, modification time, size) combination.
+    """
+    return tuple(extract_units_from_csv(csv_path))
+
+
+def get_units_from_csv(csv_path: str) -> List[Unit]:
     """
     Get available units from the CSV file.
+
+    Parsed units are cached until the file changes on disk.
     """
-    return extract_units_from_csv(csv_path)
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+
+    stat = os.stat(csv_path)
+    return list(_cached_units_from_csv(csv_path, stat.st_mtime_ns, stat.st_size))
@@ -1,8 +1,13 @@
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.colors import HexColor
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
 from PIL import Image
+import contextlib
+import io
 import os
+import threading
 
 # Define company colors as constants
 PRIMARY_COLOR = HexColor('#186685')  # Dark blue
@@ -11,73 +16,202 @@ BACKGROUND_COLOR = HexColor('#e2ecf4')  # Light background
 TEXT_COLOR = HexColor('#186685')  # Using primary color for text
 WHITE = HexColor('#ffffff')  # White
 
+# Page dimensions (letter size) and the header area at the top 15% of the page
+PAGE_WIDTH, PAGE_HEIGHT = letter
+HEADER_HEIGHT = PAGE_HEIGHT * 0.15
 
-def process_header_image(c, header_image_path, width, height, header_height):
+# Resolution the header image is decoded at; anything above this is thrown away by the PDF anyway
+HEADER_IMAGE_DPI = 150
+# JPEG settings for the cropped header; ReportLab embeds the bytes as-is, so they end up in every PDF
+HEADER_JPEG_OPTIONS = {"quality": 85, "subsampling": 2}
+
+# Header images that couldn't be cached on disk and were encoded in memory instead, keyed by
+# their cache path, so a batch of pitch decks sharing one header only crops it once
+_IN_MEMORY_HEADER_CACHE = {}
+
+# The footer is identical on every page, so it is recorded once per document under this form name
+FOOTER_FORM_NAME = "companyFooter"
+
+# Right-aligned footer details, measured once since the text and font never change
+FOOTER_WEBSITE = "www.companyname.com"
+FOOTER_SOCIAL = "LinkedIn: @companyname"
+FOOTER_WEBSITE_WIDTH = pdfmetrics.stringWidth(FOOTER_WEBSITE, "Helvetica", 8)
+FOOTER_SOCIAL_WIDTH = pdfmetrics.stringWidth(FOOTER_SOCIAL, "Helvetica", 8)
+
+
+def crop_header_image(header_image_path, width, header_height):
     """
-    Process and place the header image on the canvas.
+    Crop the header image to the aspect ratio of the header area.
 
     Args:
-        c: ReportLab canvas object
         header_image_path: Path to the header image
         width: Page width
-        height: Page height
         header_height: Height of the header area
 
     Returns:
-        None
+        PIL.Image: The cropped image
+    """
+    # Open image, letting JPEGs decode directly at a reduced scale close to the printed size
+    img = Image.open(header_image_path)
+    img.draft('RGB', (int(width * HEADER_IMAGE_DPI / 72), int(header_height * HEADER_IMAGE_DPI / 72)))
+    img_width, img_height = img.size
+
+    # Calculate dimensions for cropping
+    # We want to keep the image width-to-height ratio equal to the header area's ratio
+    target_ratio = width / header_height
+
+    if img_width / img_height > target_ratio:  # Image is wider than needed
+        # Calculate new height to maintain aspect ratio
+        crop_height = img_height
+        crop_width = crop_height * target_ratio
+
+        # Center the crop horizontally
+        left = (img_width - crop_width) / 2
+        right = left + crop_width
+
+        # Crop the image
+        return img.crop((left, 0, right, crop_height))
+    else:  # Image is taller than needed
+        # Calculate new width to maintain aspect ratio
+        crop_width = img_width
+        crop_height = crop_width / target_ratio
+
+        # Center the crop vertically - take from the middle of the image
+        top = (img_height - crop_height) / 2
+        bottom = top + crop_height
+
+        # Crop the image
+        return img.crop((0, top, crop_width, bottom))
+
+
+def header_cache_path(header_image_path, width, header_height):
     """
-    if os.path.exists(header_image_path):
-        # Open image
-        img = Image.open(header_image_path)
-        img_width, img_height = img.size
+    Path of the cached, pre-cropped copy of a header image.
 
-        # Calculate dimensions for cropping
-        # We want to keep the image width-to-height ratio equal to the header area's ratio
-        target_ratio = width / header_height
+    The source file's modification time and file size, the header dimensions and the JPEG
+    quality are part of the name, so editing the image or changing the layout produces a
+    new cache entry.
+    """
+    stat = os.stat(header_image_path)
+    quality = HEADER_JPEG_OPTIONS["quality"]
+    return (f"{header_image_path}.{stat.st_mtime_ns}.{stat.st_size}"
+            f".{int(width)}x{int(header_height)}.q{quality}.jpg")
 
-        if img_width / img_height > target_ratio:  # Image is wider than needed
-            # Calculate new height to maintain aspect ratio
-            crop_height = img_height
-            crop_width = crop_height * target_ratio
 
-            # Center the crop horizontally
-            left = (img_width - crop_width) / 2
-            right = left + crop_width
+def _save_header_cache(img_cropped, cache_path):
+    """
+    Save the cropped header image to its cache path.
 
-            # Crop the image
-            img_cropped = img.crop((left, 0, right, crop_height))
-        else:  # Image is taller than needed
-            # Calculate new width to maintain aspect ratio
-            crop_width = img_width
-            crop_height = crop_width / target_ratio
+    The image is written to a temporary file next to the cache path first, so a half-written
+    file is never picked up as cached. Its name is unique to the process and thread, so
+    several writers never share one.
+    """
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    temp_file = open(temp_path, "xb")
+    replaced = False
+    try:
+        with temp_file:
+            img_cropped.save(temp_file, "JPEG", **HEADER_JPEG_OPTIONS)
+        os.replace(temp_path, cache_path)
+        replaced = True
+    finally:
+        if not replaced:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+
+
+def prepare_header_image(header_image_path, width, header_height):
+    """
+    Get the cropped header image ready for drawing.
+
+    The cropped image is cached next to the source image, so later PDFs skip
+    decoding and cropping entirely; drawing it by path lets ReportLab embed the
+    JPEG without decoding it. This doesn't touch the canvas, so it can run in a
+    worker thread while other content is being prepared.
 
-            # Center the crop vertically - take from the middle of the image
-            top = (img_height - crop_height) / 2
-            bottom = top + crop_height
+    Args:
+        header_image_path: Path to the header image
+        width: Page width
+        header_height: Height of the header area
 
-            # Crop the image
-            img_cropped = img.crop((0, top, crop_width, bottom))
+    Returns:
+        str or ImageReader: Image to pass to drawImage, or None if there is no header image
+    """
+    if not os.path.exists(header_image_path):
+        return None
+
+    cache_path = header_cache_path(header_image_path, width, header_height)
+    if os.path.exists(cache_path):
+        return cache_path
+
+    header_image = _IN_MEMORY_HEADER_CACHE.get(cache_path)
+    if header_image is not None:
+        return header_image
+
+    img_cropped = crop_header_image(header_image_path, width, header_height)
+    try:
+        _save_header_cache(img_cropped, cache_path)
+        return cache_path
+    except OSError:
+        # The image directory isn't writable, encode the image in memory instead
+        image_buffer = io.BytesIO()
+        img_cropped.save(image_buffer, "JPEG", **HEADER_JPEG_OPTIONS)
+        image_buffer.seek(0)
+        header_image = ImageReader(image_buffer)
+        _IN_MEMORY_HEADER_CACHE[cache_path] = header_image
+        return header_image
+
+
+def process_header_image(c, header_image_path, width, height, header_height, header_image=None):
+    """
+    Process and place the header image on the canvas.
 
-        # Save the processed image temporarily
-        temp_image_path = "temp_header.jpg"
-        img_cropped.save(temp_image_path, quality=95)  # High quality
+    Args:
+        c: ReportLab canvas object
+        header_image_path: Path to the header image
+        width: Page width
+        height: Page height
+        header_height: Height of the header area
+        header_image: Result of prepare_header_image, if it was already prepared
 
-        # Place the image at the top of the page, full width
-        c.drawImage(temp_image_path, 0, height - header_height, width=width, height=header_height)
+    Returns:
+        None
+    """
+    if header_image is None:
+        header_image = prepare_header_image(header_image_path, width, header_height)
 
-        # Clean up temporary file
-        os.remove(temp_image_path)
+    if header_image is not None:
+        # Place the image at the top of the page, full width; ReportLab embeds JPEG data as-is
+        c.drawImage(header_image, 0, height - header_height, width=width, height=header_height)
 
 
 def add_company_footer(c, width, height):
     """
     Adds a professional footer with company contact details to the PDF.
 
+    The footer is drawn once per document into a form XObject, later pages only reference it.
+
     Args:
         c: ReportLab canvas object
         width: Page width
         height: Page height
     """
+    if not c.hasForm(FOOTER_FORM_NAME):
+        c.beginForm(FOOTER_FORM_NAME)
+        _draw_company_footer(c, width)
+        c.endForm()
+
+    c.doForm(FOOTER_FORM_NAME)
+
+
+def _draw_company_footer(c, width):
+    """
+    Draws the footer contents onto the canvas.
+
+    Args:
+        c: ReportLab canvas object
+        width: Page width
+    """
     # Footer positioning
     footer_height = 40
     footer_top = footer_height
@@ -114,18 +248,11 @@ def add_company_footer(c, width, height):
     c.drawCentredString(center_x, footer_top - 32, email)
 
     # Column 3: Website & Social (right-aligned)
-    website = "www.companyname.com"
-    social = "LinkedIn: @companyname"
-
-    # Right-aligned text
-    website_width = c.stringWidth(website, "Helvetica", 8)
-    social_width = c.stringWidth(social, "Helvetica", 8)
-
-    c.drawString(width - margin - website_width, footer_top - 22, website)
-    c.drawString(width - margin - social_width, footer_top - 32, social)
+    c.drawString(width - margin - FOOTER_WEBSITE_WIDTH, footer_top - 22, FOOTER_WEBSITE)
+    c.drawString(width - margin - FOOTER_SOCIAL_WIDTH, footer_top - 32, FOOTER_SOCIAL)
 
 
-def initialize_pdf_layout(output_filename, header_image_path, title="Investment Opportunity"):
+def initialize_pdf_layout(output_filename, header_image_path, title="Investment Opportunity", header_image=None):
     """
     Initializes a PDF with the standard layout including header image, title area, and footer.
 
@@ -133,12 +260,12 @@ def initialize_pdf_layout(output_filename, header_image_path, title="Investment
         output_filename (str): Path where to save the PDF
         header_image_path (str): Path to the header image
         title (str): Title for the document
+        header_image: Header image already returned by prepare_header_image, prepared here if not given
 
     Returns:
         tuple: (canvas, width, height, header_height, content_start_y) for use in content generation
     """
-    # Define page dimensions (letter size)
-    width, height = letter
+    width, height = PAGE_WIDTH, PAGE_HEIGHT
 
     # Create a new PDF with ReportLab
     c = canvas.Canvas(output_filename, pagesize=letter)
@@ -147,11 +274,10 @@ def initialize_pdf_layout(output_filename, header_image_path, title="Investment
     c.setFillColor(WHITE)
     c.rect(0, 0, width, height, fill=True)
 
-    # Calculate header area (top 15% of page)
-    header_height = height * 0.15
+    header_height = HEADER_HEIGHT
 
     # Process and place the header image
-    process_header_image(c, header_image_path, width, height, header_height)
+    process_header_image(c, header_image_path, width, height, header_height, header_image)
 
     # Add title below the header area
     c.setFillColor(PRIMARY_COLOR)
@@ -1,81 +1,21 @@
 import layout
-from pdfworker import process_developer_pdf
+import csv_parser
+from reportlab.pdfbase import pdfmetrics
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+import logging
 import os
-import sys
-
-csv_file_path = os.path.join(os.path.dirname(__file__), "Unit_Availability.csv")
-
-# Make sure csv_parser.py is in the same directory
-try:
-    import csv_parser
-except ImportError:
-    print("Warning: csv_parser.py module not found. Using built-in fallback implementation.")
-
-
-    # Define minimal fallback implementation of csv_parser
-    class csv_parser:
-        @staticmethod
-        def get_project_data(csv_path, project_name=None):
-            """Fallback implementation that returns default data"""
-            description_lines = [
-                "CSV parser module not found. This is placeholder content.",
-                "Please ensure csv_parser.py is in the same directory as this script.",
-                "This property offers an exceptional investment opportunity with modern amenities",
-                "and attractive returns in a prime location."
-            ]
-
-            available_units = [
-                {
-                    "unit_id": "A101",
-                    "size": "1,250",
-                    "price": "$750,000",
-                    "bedrooms": 2,
-                    "bathrooms": 2,
-                    "features": "Corner unit with balcony"
-                },
-                {
-                    "unit_id": "B205",
-                    "size": "1,800",
-                    "price": "$1,050,000",
-                    "bedrooms": 3,
-                    "bathrooms": 2.5,
-                    "features": "Penthouse with city view"
-                }
-            ]
-
-            project_info = {
-                'name': 'Default Project',
-                'developer': 'Default Developer',
-                'location': {'url': ''}
-            }
-
-            return description_lines, available_units, project_info
-
-        @staticmethod
-        def list_projects_in_csv(csv_path):
-            """Fallback implementation that returns a default project"""
-            return [{
-                'name': 'Default Project',
-                'developer': 'Default Developer',
-                'unit_count': 2,
-                'location_url': ''
-            }]
+import re
 
-def create_pitch_deck(output_filename, header_image_path, developer_pdf=None, csv_path=None,
-                      project_name=None, title="Investment Opportunity", description_lines=None):
-    """
-    Creates a one-page pitch deck PDF with property details and description.
+log = logging.getLogger(__name__)
+
+
+def load_available_units(csv_path=None, developer_pdf=None):
     """
-    # Initialize with default description if none provided
-    if not description_lines:
-        description_lines = [
-            "This premium investment property offers an exceptional opportunity in the heart of the city's",
-            "most vibrant district. Recently renovated with high-end finishes, the property features modern",
-            "amenities, energy-efficient systems, and a versatile floor plan suitable for various commercial",
-            "purposes. With strong tenant demand in the area and projected growth, this investment promises",
-            "consistent returns and appreciation potential."
-        ]
+    Loads the units for the pitch deck from the CSV, or the developer PDF if no CSV is given.
 
+    Falls back to the default units if neither is available or loading fails.
+    """
     # Get available units from CSV if provided
     if csv_path and os.path.exists(csv_path):
         try:
@@ -85,57 +25,87 @@ def create_pitch_deck(output_filename, header_image_path, developer_pdf=None, cs
                 # Fall back to default content if no units found
                 _, available_units = default_content()
 
-            print(f"Extracted {len(available_units)} units from CSV")
+            log.info("Extracted %d units from CSV", len(available_units))
 
         except Exception as e:
-            print(f"Error reading CSV file: {e}")
+            log.error("Error reading CSV file: %s", e)
             # Fall back to default content
             _, available_units = default_content()
     elif developer_pdf and os.path.exists(developer_pdf):
         # Fall back to PDF processing if CSV is not provided
         try:
+            # Imported here so the CSV and default paths don't pay for loading openai and PyMuPDF
+            from pdfworker import process_developer_pdf
+
             desc_lines, available_units = process_developer_pdf(developer_pdf)
             # Only use the units, not the description from PDF
         except Exception as e:
-            print(f"Error processing PDF: {e}")
+            log.error("Error processing PDF: %s", e)
             # Fall back to default content
             _, available_units = default_content()
     else:
         # Default content if neither CSV nor PDF is provided
         _, available_units = default_content()
 
-    # Initialize the PDF with our layout
-    c, width, height, header_height, content_start_y = layout.initialize_pdf_layout(
-        output_filename, header_image_path, title
-    )
+    return available_units
 
-    # ============ DESCRIPTION SECTION ============
-    section_y = content_start_y  # Start position for the first section
 
-    # Add Description section header
-    c.setFillColor(layout.PRIMARY_COLOR)
-    c.setFont("Helvetica", 12)
-    c.drawString(50, section_y, "Property Description:")
+@lru_cache(maxsize=4096)
+def text_width(text, font_name, font_size):
+    """
+    Returns the width of a string in the given font. Table values like floors, bedroom counts
+    and empty cells repeat a lot, so each distinct string is only measured once.
+    """
+    return pdfmetrics.stringWidth(text, font_name, font_size)
 
-    # Add the description paragraph
-    c.setFillColor(layout.TEXT_COLOR)
-    c.setFont("Helvetica", 10)
-    line_height = 15  # spacing between lines
-    for i, line in enumerate(description_lines):
-        c.drawString(70, section_y - 20 - (i * line_height), line)
 
-    # ============ AVAILABLE UNITS SECTION ============
-    # Calculate the Y position for the units section (below description)
-    units_y = section_y - 30 - (len(description_lines) * line_height)
+def row_text_baselines(row_edges, font_size):
+    """
+    Computes the baseline that vertically centers text of the given size in each table row,
+    for rows spanning consecutive entries of row_edges (top to bottom).
+    """
+    text_height = font_size  # Approximate text height
+    return [
+        y_bottom + (y_top - y_bottom - text_height) / 2 + text_height * 0.3  # Adjust for visual center
+        for y_top, y_bottom in zip(row_edges, row_edges[1:])
+    ]
 
-    # Add Available Units section header
-    c.setFillColor(layout.PRIMARY_COLOR)
-    c.setFont("Helvetica", 12)
-    c.drawString(50, units_y, "Available Units:")
 
-    # Table setup - centered on page with borders
-    table_width = 500  # Total width of the table
-    left_margin = (width - table_width) / 2  # Center the table horizontally
+def format_amount(value):
+    """
+    Formats a calculated amount with thousands separators, leaving zero amounts blank.
+    Values that are already text (e.g. units extracted from a PDF) are shown as they are.
+    """
+    if isinstance(value, (int, float)):
+        return f"{value:,.0f}" if value > 0 else ""
+    return str(value)
+
+
+def format_percentage(value):
+    """
+    Formats a calculated percentage such as the ROI, leaving zero values blank.
+    Values that are already text are shown as they are.
+    """
+    if isinstance(value, (int, float)):
+        return f"{value:.1f}%" if value > 0 else ""
+    return str(value)
+
+
+def format_area(value):
+    """
+    Formats an area with its m² unit, leaving missing areas blank.
+    """
+    return f"{value} m²" if value else ""
+
+
+def _build_table_geometry(page_width, table_width=500):
+    """
+    Computes the units table column layout, centered on the page.
+
+    Returns:
+        tuple: (cols, col_widths, table_width, left_margin) with the absolute x position and width of each column
+    """
+    left_margin = (page_width - table_width) / 2  # Center the table horizontally
 
     # Define column positions and widths for the table (relative to left margin)
     col_widths = {
@@ -157,7 +127,7 @@ def create_pitch_deck(output_filename, header_image_path, developer_pdf=None, cs
     if total_col_width != table_width:
         # Adjust each column width proportionally to match the table_width
         ratio = table_width / total_col_width
-        col_widths = {key: int(width * ratio) for key, width in col_widths.items()}
+        col_widths = {key: int(col_width * ratio) for key, col_width in col_widths.items()}
         # Ensure the sum equals table_width (account for rounding)
         adjustment = table_width - sum(col_widths.values())
         col_widths['roi'] += adjustment  # Add any rounding difference to the last column
@@ -165,143 +135,266 @@ def create_pitch_deck(output_filename, header_image_path, developer_pdf=None, cs
     # Calculate absolute positions of columns
     cols = {}
     current_pos = left_margin
-    for key, width in col_widths.items():
+    for key, col_width in col_widths.items():
         cols[key] = current_pos
-        current_pos += width
+        current_pos += col_width
+
+    return cols, col_widths, table_width, left_margin
+
+
+# The units table layout only depends on the page size, so it is computed once
+_COLS, _COL_WIDTHS, _TABLE_WIDTH, _LEFT_MARGIN = _build_table_geometry(layout.PAGE_WIDTH)
+
+# Units table header labels, in column order
+_TABLE_HEADERS = [
+    ('id', "Unit ID"),
+    ('floor', "Floor"),
+    ('bed', "Bed"),
+    ('area', "Int. Area"),
+    ('total', "Total Area"),
+    ('price', "Price"),
+    ('tax', "VAT/Transfer"),
+    ('total_cost', "Total Cost"),
+    ('price_m2', "Price/m²"),
+    ('rent', "Rental Rate"),
+    ('roi', "ROI"),
+]
+
+# Unit field shown in each units table column and how it is formatted, in column order
+_TABLE_FIELDS = [
+    ('id', "unit_id", str),
+    ('floor', "floor", str),
+    ('bed', "bedrooms", str),
+    ('area', "internal_area", format_area),
+    ('total', "total_covered", format_area),
+    ('price', "asking_price", str),
+    ('tax', "tax_value", str),  # VAT or Transfer Fee - display only the value
+    ('total_cost', "total_cost", format_amount),
+    ('price_m2', "price_per_m2", format_amount),
+    ('rent', "rental_rate", str),
+    ('roi', "roi", format_percentage),
+]
+
+# Most units shown in the table, more don't fit on the page
+_TABLE_MAX_UNITS = 7
+
+# Units table fonts, the size is the same for the header and the data rows
+_TABLE_FONT_SIZE = 7
+_TABLE_HEADER_FONT = "Helvetica-Bold"
+_TABLE_CELL_FONT = "Helvetica"
+
+# The header labels and fonts never change, so each label's centered x position is computed once
+_TABLE_HEADER_XS = [
+    _COLS[key] + (_COL_WIDTHS[key] - text_width(label, _TABLE_HEADER_FONT, _TABLE_FONT_SIZE)) / 2
+    for key, label in _TABLE_HEADERS
+]
+
+
+def create_pitch_deck(output_filename, header_image_path, developer_pdf=None, csv_path=None,
+                      project_name=None, title="Investment Opportunity", description_lines=None,
+                      available_units=None):
+    """
+    Creates a one-page pitch deck PDF with property details and description.
+
+    Units that were already loaded can be passed as available_units, the CSV and PDF are then not read.
+    """
+    # Initialize with default description if none provided
+    if not description_lines:
+        description_lines, _ = default_content()
+
+    # Crop the header image in a worker thread while the units are loaded,
+    # PIL releases the GIL while it decodes and resizes the image
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        header_future = executor.submit(
+            layout.prepare_header_image, header_image_path, layout.PAGE_WIDTH, layout.HEADER_HEIGHT
+        )
+        if available_units is None:
+            available_units = load_available_units(csv_path, developer_pdf)
+        header_image = header_future.result()
+
+    # Initialize the PDF with our layout
+    c, width, height, header_height, content_start_y = layout.initialize_pdf_layout(
+        output_filename, header_image_path, title, header_image
+    )
+
+    # ============ DESCRIPTION SECTION ============
+    section_y = content_start_y  # Start position for the first section
+
+    # Add Description section header
+    c.setFillColor(layout.PRIMARY_COLOR)
+    c.setFont("Helvetica", 12)
+    c.drawString(50, section_y, "Property Description:")
+
+    # Add the description paragraph as a single text object
+    line_height = 15  # spacing between lines
+    description = c.beginText(70, section_y - 20)
+    description.setFont("Helvetica", 10, leading=line_height)
+    description.setFillColor(layout.TEXT_COLOR)
+    for line in description_lines:
+        description.textLine(line)
+    c.drawText(description)
+
+    # ============ AVAILABLE UNITS SECTION ============
+    # Calculate the Y position for the units section (below description)
+    units_y = section_y - 30 - (len(description_lines) * line_height)
+
+    # Add Available Units section header
+    c.setFillColor(layout.PRIMARY_COLOR)
+    c.setFont("Helvetica", 12)
+    c.drawString(50, units_y, "Available Units:")
+
+    # Table setup - centered on page with borders, the column geometry is computed once at import
+    cols, col_widths, table_width, left_margin = _COLS, _COL_WIDTHS, _TABLE_WIDTH, _LEFT_MARGIN
 
     # Table positioning and measurements
     header_y = units_y - 25  # Adjusted down to add space after section title
     row_height = 20  # Increased row height to prevent overlap
 
     # Draw table outline
-    table_rows = min(8, len(available_units) + 1)  # Header + data rows (max 7 data rows)
+    table_rows = min(_TABLE_MAX_UNITS, len(available_units)) + 1  # Header + data rows
     table_height = row_height * table_rows
 
+    # Y position of every horizontal row edge, from the top of the header down to the table bottom
+    row_edges = [header_y - i * row_height for i in range(table_rows + 1)]
+
     # Draw outer border of table
     c.setStrokeColor(layout.SECONDARY_COLOR)
+    c.setLineWidth(0.75)  # Same thin rule as the footer separator
     c.rect(left_margin, header_y - table_height, table_width, table_height)
 
     # Draw header row background
     c.setFillColor(layout.SECONDARY_COLOR.clone(alpha=0.2))  # Light background color
     c.rect(left_margin, header_y - row_height, table_width, row_height, fill=1, stroke=0)
 
-    # Draw header row border
+    # Draw the grid as a single path that is stroked once
     c.setStrokeColor(layout.SECONDARY_COLOR)
-    c.line(left_margin, header_y - row_height, left_margin + table_width, header_y - row_height)
+    grid = c.beginPath()
 
-    # Draw vertical lines for columns
-    current_x = left_margin
-    for i, width in enumerate(col_widths.values()):
-        if i > 0:  # Skip the leftmost edge since it's part of the rectangle
-            c.line(current_x, header_y, current_x, header_y - table_height)
-        current_x += width
+    # Vertical lines for columns
+    for column_x in list(cols.values())[1:]:  # Skip the leftmost edge since it's part of the rectangle
+        grid.moveTo(column_x, header_y)
+        grid.lineTo(column_x, header_y - table_height)
 
-    # Function to perfectly center text both horizontally and vertically in a cell
-    def draw_centered_text(c, x, width, y_top, y_bottom, text, is_header=False):
-        # Select font based on whether it's a header or not
-        font_name = "Helvetica-Bold" if is_header else "Helvetica"
-        font_size = 7
+    # Horizontal lines between rows, the first one is the header row border
+    for row_y in row_edges[1:table_rows]:
+        grid.moveTo(left_margin, row_y)
+        grid.lineTo(left_margin + table_width, row_y)
 
-        # Set the font for proper text width calculation
-        c.setFont(font_name, font_size)
+    c.drawPath(grid, stroke=1, fill=0)
 
-        # Calculate horizontal center position
-        text_width = c.stringWidth(text, font_name, font_size)
-        centered_x = x + (width - text_width) / 2
+    # Vertically centered text baseline of every row, the header row first
+    baselines = row_text_baselines(row_edges, _TABLE_FONT_SIZE)
 
-        # Calculate vertical center position
-        cell_height = y_top - y_bottom
-        text_height = font_size  # Approximate text height
-        centered_y = y_bottom + (cell_height - text_height) / 2 + text_height * 0.3  # Adjust for visual center
+    # Function to perfectly center a data cell's text horizontally, on the row's precomputed baseline.
+    # The text is appended to a text object whose font and color are set once for all data cells,
+    # this only measures with the font.
+    def draw_centered_text(text_object, x, width, y, text):
+        # Calculate horizontal center position
+        centered_x = x + (width - text_width(text, _TABLE_CELL_FONT, _TABLE_FONT_SIZE)) / 2
 
         # Draw the text
-        c.drawString(centered_x, centered_y, text)
+        text_object.setTextOrigin(centered_x, y)
+        text_object.textOut(text)
+
+    # All table text, headers and data, goes into a single text object
+    cells = c.beginText()
 
     # Draw table headers (centered vertically and horizontally)
-    c.setFillColor(layout.PRIMARY_COLOR)
-    c.setFont("Helvetica-Bold", 7)
-
-    # Draw headers with perfect centering
-    header_top = header_y
-    header_bottom = header_y - row_height
-    draw_centered_text(c, cols['id'], col_widths['id'], header_top, header_bottom, "Unit ID", True)
-    draw_centered_text(c, cols['floor'], col_widths['floor'], header_top, header_bottom, "Floor", True)
-    draw_centered_text(c, cols['bed'], col_widths['bed'], header_top, header_bottom, "Bed", True)
-    draw_centered_text(c, cols['area'], col_widths['area'], header_top, header_bottom, "Int. Area", True)
-    draw_centered_text(c, cols['total'], col_widths['total'], header_top, header_bottom, "Total Area", True)
-    draw_centered_text(c, cols['price'], col_widths['price'], header_top, header_bottom, "Price", True)
-    draw_centered_text(c, cols['tax'], col_widths['tax'], header_top, header_bottom, "VAT/Transfer", True)
-    draw_centered_text(c, cols['total_cost'], col_widths['total_cost'], header_top, header_bottom, "Total Cost", True)
-    draw_centered_text(c, cols['price_m2'], col_widths['price_m2'], header_top, header_bottom, "Price/m²", True)
-    draw_centered_text(c, cols['rent'], col_widths['rent'], header_top, header_bottom, "Rental Rate", True)
-    draw_centered_text(c, cols['roi'], col_widths['roi'], header_top, header_bottom, "ROI", True)
-
-    # Add horizontal lines between rows
-    for i in range(1, min(8, len(available_units) + 1)):
-        row_y = header_y - (i * row_height)
-        c.line(left_margin, row_y, left_margin + table_width, row_y)
+    cells.setFont(_TABLE_HEADER_FONT, _TABLE_FONT_SIZE)
+    cells.setFillColor(layout.PRIMARY_COLOR)
 
-    # Add units data with perfect centering in each cell
-    c.setFillColor(layout.TEXT_COLOR)
-    c.setFont("Helvetica", 7)
+    # Draw headers at their precomputed centered positions
+    for header_x, (_, label) in zip(_TABLE_HEADER_XS, _TABLE_HEADERS):
+        cells.setTextOrigin(header_x, baselines[0])
+        cells.textOut(label)
 
-    for i, unit in enumerate(available_units[:7]):  # Limit to 7 units to fit in page
-        if i >= 7:  # Safety check
-            break
+    # Add units data with perfect centering in each cell
+    cells.setFont(_TABLE_CELL_FONT, _TABLE_FONT_SIZE)
+    cells.setFillColor(layout.TEXT_COLOR)
 
-        # Calculate row top and bottom positions for vertical centering
-        row_top = header_y - (i + 1) * row_height
-        row_bottom = header_y - (i + 2) * row_height
+    # Format all cell texts up front, limited to the units that fit in page
+    rows = [[format_value(unit.get(field, "")) for _, field, format_value in _TABLE_FIELDS]
+            for unit in available_units[:_TABLE_MAX_UNITS]]
 
+    for row, baseline in zip(rows, baselines[1:]):
         # Draw each column value perfectly centered in its cell
-        unit_id = str(unit.get("unit_id", ""))
-        draw_centered_text(c, cols['id'], col_widths['id'], row_top, row_bottom, unit_id)
+        for (key, _, _), text in zip(_TABLE_FIELDS, row):
+            draw_centered_text(cells, cols[key], col_widths[key], baseline, text)
+
+    c.drawText(cells)
 
-        floor = str(unit.get("floor", ""))
-        draw_centered_text(c, cols['floor'], col_widths['floor'], row_top, row_bottom, floor)
+    # Save the PDF
+    c.save()
 
-        bedrooms = str(unit.get("bedrooms", ""))
-        draw_centered_text(c, cols['bed'], col_widths['bed'], row_top, row_bottom, bedrooms)
+    log.info("PDF created successfully: %s", output_filename)
 
-        # Format areas with m² units
-        internal_area = unit.get("internal_area", "")
-        if internal_area:
-            internal_area = f"{internal_area} m²"
-        draw_centered_text(c, cols['area'], col_widths['area'], row_top, row_bottom, internal_area)
 
-        total_covered = unit.get("total_covered", "")
-        if total_covered:
-            total_covered = f"{total_covered} m²"
-        draw_centered_text(c, cols['total'], col_widths['total'], row_top, row_bottom, total_covered)
+def _create_project_pitch_deck(project_name, output_filename, header_image_path, available_units):
+    """Creates the pitch deck of a single project, run in a batch_create worker process."""
+    create_pitch_deck(
+        output_filename=output_filename,
+        header_image_path=header_image_path,
+        project_name=project_name,
+        title=project_name,
+        available_units=available_units,
+    )
+    return output_filename
 
-        # Price and financial information
-        asking_price = str(unit.get("asking_price", ""))
-        draw_centered_text(c, cols['price'], col_widths['price'], row_top, row_bottom, asking_price)
 
-        # VAT or Transfer Fee - display only the value
-        tax_value = str(unit.get("tax_value", ""))
-        draw_centered_text(c, cols['tax'], col_widths['tax'], row_top, row_bottom, tax_value)
+def _batch_output_filenames(projects, output_dir):
+    """
+    Output path of each project's pitch deck, named after the project.
 
-        # Total Cost
-        total_cost = str(unit.get("total_cost", ""))
-        draw_centered_text(c, cols['total_cost'], col_widths['total_cost'], row_top, row_bottom, total_cost)
+    Names that map to the same file, like "Sea View" and "Sea-View", get a numbered
+    suffix, so no two workers write the same PDF. The comparison ignores case,
+    as the file system may.
+    """
+    output_filenames = []
+    used_filenames = set()
+    for project_name in projects:
+        stem = "pitch_deck_" + (re.sub(r'[^\w]+', '_', project_name).strip('_') or "project")
+        output_filename = os.path.join(output_dir, f"{stem}.pdf")
+        suffix = 2
+        while output_filename.casefold() in used_filenames:
+            output_filename = os.path.join(output_dir, f"{stem}_{suffix}.pdf")
+            suffix += 1
+        used_filenames.add(output_filename.casefold())
+        output_filenames.append(output_filename)
+    return output_filenames
+
+
+def batch_create(projects, csv_path, header_image_path, output_dir="."):
+    """
+    Creates one pitch deck per project, in parallel worker processes.
 
-        # Price per m²
-        price_per_m2 = str(unit.get("price_per_m2", ""))
-        draw_centered_text(c, cols['price_m2'], col_widths['price_m2'], row_top, row_bottom, price_per_m2)
+    The CSV is parsed and the header image cropped once up front, every worker
+    then only lays out and writes its own PDF.
 
-        # Rental Rate
-        rental_rate = str(unit.get("rental_rate", ""))
-        draw_centered_text(c, cols['rent'], col_widths['rent'], row_top, row_bottom, rental_rate)
+    Args:
+        projects: Project names, each is used as the title of its pitch deck
+        csv_path: Path to the units CSV shared by all projects
+        header_image_path: Path to the header image
+        output_dir: Directory the pitch decks are written to
 
-        # ROI
-        roi = str(unit.get("roi", ""))
-        draw_centered_text(c, cols['roi'], col_widths['roi'], row_top, row_bottom, roi)
+    Returns:
+        list: Paths of the created PDFs, in the order of projects
+    """
+    projects = list(projects)
+    # Only the units that fit in the table are sent to the workers
+    available_units = load_available_units(csv_path)[:_TABLE_MAX_UNITS]
+    # Fill the on-disk header cache, so the workers don't all crop the image themselves
+    layout.prepare_header_image(header_image_path, layout.PAGE_WIDTH, layout.HEADER_HEIGHT)
 
-    # Save the PDF
-    c.save()
+    output_filenames = _batch_output_filenames(projects, output_dir)
 
-    print(f"PDF created successfully: {output_filename}")
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(
+            _create_project_pitch_deck,
+            projects,
+            output_filenames,
+            [header_image_path] * len(projects),
+            [available_units] * len(projects),
+        ))
 
 
 
@@ -347,6 +440,9 @@ def default_content():
 
 
 if __name__ == "__main__":
+    # Show progress messages when run as a script
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Example usage with CSV
     csv_path = "Unit_Availability.csv"
 
@@ -360,14 +456,14 @@ if __name__ == "__main__":
                 title="Premium Investment Property"  # Use default title
             )
         except Exception as e:
-            print(f"Error processing CSV file: {e}")
+            log.error("Error processing CSV file: %s", e)
             # Fall back to default
             create_pitch_deck(
                 output_filename="pitch_deck_example.pdf",
                 header_image_path="header_image.jpg"
             )
     else:
-        print(f"CSV file not found at {csv_path}. Using default content.")
+        log.warning("CSV file not found at %s. Using default content.", csv_path)
         # Fall back to original example with optional PDF
         create_pitch_deck(
             output_filename="pitch_deck_example.pdf",
@@ -1,15 +1,44 @@
+import logging
 import os
-import fitz  # PyMuPDF for PDF extraction
-import openai
 from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import json
 
+log = logging.getLogger(__name__)
+
 # Load environment variables from .env file
 load_dotenv()
 
 # Get API key from environment variables for security
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-openai.api_key = OPENAI_API_KEY
+
+OPENAI_MODEL = "gpt-4-turbo"
+
+# How much of the PDF text is sent along with each prompt, in tokens,
+# or in characters when tiktoken isn't installed
+PROMPT_TEXT_TOKENS = 6000
+PROMPT_TEXT_CHARS = 8000
+
+# OpenAI responses are cached here, keyed by the PDF contents and the prompt,
+# so re-running on an unchanged PDF doesn't call the API again
+RESPONSE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pitch_gen")
+
+
+def _parse_units(response):
+    """Parse the units out of a JSON mode reply, raising TypeError, ValueError or KeyError if it has none."""
+    return json.loads(response)["units"]
+
+
+def _is_usable_response(response, validate=None):
+    """Whether a reply passes the caller's validate function, if there is one."""
+    if validate is None:
+        return True
+    try:
+        validate(response)
+    except (TypeError, ValueError, KeyError):
+        return False
+    return True
 
 
 class PDFProcessor:
@@ -21,41 +50,129 @@ class PDFProcessor:
             pdf_path (str): Path to the PDF file to process
         """
         self.pdf_path = pdf_path
-        self.text_content = self._extract_text_from_pdf()
+        # The file is read once, the same bytes are hashed and parsed
+        pdf_bytes = self._read_pdf()
+        self.pdf_hash = self._hash_pdf(pdf_bytes)
+        self.text_content = self._extract_text_from_pdf(pdf_bytes)
+        # Limiting content to avoid token limits, done once for all prompts
+        self.prompt_text = self._truncate_for_prompt(self.text_content)
+
+    def _read_pdf(self):
+        """Read the whole PDF file with a single call, returning None if it can't be read."""
+        try:
+            with open(self.pdf_path, 'rb') as pdf_file:
+                return pdf_file.read()
+        except OSError as e:
+            log.error("Error reading PDF: %s", e)
+            return None
+
+    def _hash_pdf(self, pdf_bytes):
+        """Hash the PDF contents, identifying the file for the response cache."""
+        if pdf_bytes is None:
+            return None
+        return hashlib.sha256(pdf_bytes).hexdigest()
+
+    def _response_cache_path(self, prompt, json_mode=False):
+        """Path of the cached API response for a prompt about this PDF, or None if it can't be cached."""
+        if not self.pdf_hash:
+            return None
+        prompt_hash = hashlib.sha256(f"{OPENAI_MODEL}\n{json_mode}\n{prompt}".encode("utf-8")).hexdigest()
+        return os.path.join(RESPONSE_CACHE_DIR, f"{self.pdf_hash}-{prompt_hash}.json")
+
+    def _load_cached_response(self, cache_path):
+        """Load a previously cached API response, returning None if there is none."""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as cache_file:
+                return json.load(cache_file)["response"]
+        except (OSError, ValueError, KeyError):
+            return None
 
-    def _extract_text_from_pdf(self):
-        """Extract text content from the PDF file."""
+    def _save_cached_response(self, cache_path, response):
+        """Save an API response to the cache, a failure to do so is not fatal."""
         try:
-            doc = fitz.open(self.pdf_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            return text
+            os.makedirs(RESPONSE_CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as cache_file:
+                json.dump({"response": response}, cache_file)
+        except OSError as e:
+            log.error("Error caching OpenAI response: %s", e)
+
+    def _extract_text_from_pdf(self, pdf_bytes):
+        """Extract text content from the PDF file's bytes."""
+        import fitz  # PyMuPDF for PDF extraction, imported on first use as it is slow to load
+
+        if pdf_bytes is None:
+            return ""
+
+        try:
+            # Let PyMuPDF parse the already read file from memory
+            with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+                # Plain text extraction with ligatures expanded, collected in a list and joined once
+                flags = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+                return "".join(page.get_text("text", flags=flags) for page in doc)
         except Exception as e:
-            print(f"Error extracting text from PDF: {str(e)}")
+            log.error("Error extracting text from PDF: %s", e)
             return ""
 
+    def _truncate_for_prompt(self, text):
+        """Truncate text to what fits in a prompt, counting tokens when tiktoken is available."""
+        try:
+            import tiktoken
+            encoding = tiktoken.encoding_for_model(OPENAI_MODEL)
+        except Exception:
+            # tiktoken isn't installed or can't load the model's encoding
+            return text[:PROMPT_TEXT_CHARS]
+
+        return encoding.decode(encoding.encode(text)[:PROMPT_TEXT_TOKENS])
+
     # Replace the _call_openai_api method with this:
-    def _call_openai_api(self, prompt):
-        """Make a call to OpenAI API with the given prompt using the new API."""
+    def _call_openai_api(self, prompt, json_mode=False, validate=None):
+        """
+        Make a call to OpenAI API with the given prompt using the new API, reusing cached responses.
+
+        With json_mode the model is constrained to answer with a single valid JSON object.
+        Only complete replies are cached, and only if validate (when given) doesn't raise
+        TypeError, ValueError or KeyError for them, so a bad reply isn't reused on every later run.
+        """
+        cache_path = self._response_cache_path(prompt, json_mode)
+        if cache_path:
+            cached_response = self._load_cached_response(cache_path)
+            if cached_response is not None and _is_usable_response(cached_response, validate):
+                return cached_response
+
+        system_message = "You are a helpful assistant that extracts real estate information from documents."
+        extra_options = {}
+        if json_mode:
+            system_message += " Respond with a JSON object."
+            extra_options["response_format"] = {"type": "json_object"}
+
         try:
+            # Imported on first use, loading openai takes longer than everything else in this module
+            import openai
+
             client = openai.OpenAI(api_key=OPENAI_API_KEY)
 
             response = client.chat.completions.create(
-                model="gpt-4-turbo",  # Use the appropriate model
+                model=OPENAI_MODEL,  # Use the appropriate model
                 messages=[
-                    {"role": "system",
-                     "content": "You are a helpful assistant that extracts real estate information from documents."},
+                    {"role": "system", "content": system_message},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,  # Low temperature for more factual responses
-                max_tokens=1000
+                max_tokens=1000,
+                **extra_options
             )
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
+            finish_reason = response.choices[0].finish_reason
         except Exception as e:
-            print(f"Error calling OpenAI API: {str(e)}")
+            log.error("Error calling OpenAI API: %s", e)
             return None
 
+        # A reply cut off by max_tokens is not cached, the next run asks again
+        if (cache_path and content is not None and finish_reason == "stop"
+                and _is_usable_response(content, validate)):
+            self._save_cached_response(cache_path, content)
+        return content
+
     def extract_property_description(self):
         """
         Extract a compelling property description from the PDF.
@@ -69,7 +186,7 @@ class PDFProcessor:
         Format the response as a simple list of 5 text lines, each line should be 80-100 characters.
 
         PDF CONTENT:
-        {self.text_content[:8000]}  # Limiting content to avoid token limits
+        {self.prompt_text}
         """
 
         response = self._call_openai_api(prompt)
@@ -104,21 +221,21 @@ class PDFProcessor:
         - Number of bedrooms/bathrooms (if available)
         - Any special features
 
-        Format your response as a valid JSON array of objects, with each object representing a unit.
+        Format your response as a JSON object with a "units" key holding an array of objects,
+        with each object representing a unit.
 
         PDF CONTENT:
-        {self.text_content[:8000]}  # Limiting content to avoid token limits
+        {self.prompt_text}
         """
 
-        response = self._call_openai_api(prompt)
+        response = self._call_openai_api(prompt, json_mode=True, validate=_parse_units)
 
         try:
-            # Try to parse the response as JSON
-            units = json.loads(response)
-            return units
-        except:
+            # JSON mode guarantees valid JSON, but the API call itself may have failed
+            return _parse_units(response)
+        except (TypeError, ValueError, KeyError):
             # If JSON parsing fails, return default placeholder data
-            print("Failed to parse available units data. Using placeholder data.")
+            log.warning("Failed to parse available units data. Using placeholder data.")
             return [
                 {
                     "unit_id": "A101",
@@ -159,11 +276,14 @@ def process_developer_pdf(pdf_path):
     """
     processor = PDFProcessor(pdf_path)
 
-    # Extract property description
-    description_lines = processor.extract_property_description()
+    # The two extractions are independent API calls, so run them concurrently;
+    # the threads spend nearly all their time waiting on the network
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        description_future = executor.submit(processor.extract_property_description)
+        units_future = executor.submit(processor.extract_available_units)
 
-    # Extract available units
-    available_units = processor.extract_available_units()
+        description_lines = description_future.result()
+        available_units = units_future.result()
 
     return description_lines, available_units
 
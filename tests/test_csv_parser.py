@@ -0,0 +1,121 @@
+import csv
+import os
+import tempfile
+import unittest
+
+import csv_parser
+from main import format_amount, format_percentage
+
+
+def baseline_units(csv_path):
+    """
+    The original DictReader based parser, kept as the reference for the calculated fields.
+    """
+    units = []
+    with open(csv_path, 'r', encoding='utf-8-sig') as csvfile:
+        for row in csv.DictReader(csvfile):
+            vat_str = row.get('VAT', '').strip()
+            transfer_fee_str = row.get('Transfer Fee', '').strip()
+
+            try:
+                vat_value = float(''.join(c for c in vat_str if c.isdigit() or c == '.')) if vat_str else 0
+            except ValueError:
+                vat_value = 0
+            try:
+                transfer_fee_value = float(
+                    ''.join(c for c in transfer_fee_str if c.isdigit() or c == '.')) if transfer_fee_str else 0
+            except ValueError:
+                transfer_fee_value = 0
+
+            if vat_value > 0:
+                tax_type, tax_value, tax_amount = "VAT", vat_str, vat_value
+            elif transfer_fee_value > 0:
+                tax_type, tax_value, tax_amount = "Transfer Fee", transfer_fee_str, transfer_fee_value
+            else:
+                tax_type, tax_value, tax_amount = "", "", 0
+
+            asking_price_str = row.get('Asking Price', '0')
+            total_covered_str = row.get('Total Covered Area', '0')
+            rental_rate = row.get('Rental Rate', '')
+
+            try:
+                asking_price = float(''.join(c for c in asking_price_str if c.isdigit() or c == '.'))
+                total_covered = float(''.join(c for c in total_covered_str if c.isdigit() or c == '.'))
+                price_per_m2 = asking_price / total_covered if total_covered > 0 else 0
+                total_cost = asking_price + tax_amount
+                roi = 0
+                if rental_rate:
+                    annual_rental = float(''.join(c for c in rental_rate if c.isdigit() or c == '.')) * 12
+                    roi = (annual_rental / asking_price) * 100 if asking_price > 0 else 0
+            except (ValueError, ZeroDivisionError):
+                price_per_m2 = 0
+                total_cost = 0
+                roi = 0
+
+            units.append({
+                'unit_id': row.get('Unit ID', ''),
+                'tax_type': tax_type,
+                'tax_value': tax_value,
+                'total_cost': f"{total_cost:,.0f}" if total_cost > 0 else '',
+                'price_per_m2': f"{price_per_m2:,.0f}" if price_per_m2 > 0 else '',
+                'roi': f"{roi:.1f}%" if roi > 0 else '',
+            })
+    return units
+
+
+HEADER = ['Unit ID', 'Floor', 'Typology', 'Internal Area', 'Covered Area', 'Total Covered Area',
+          'Asking Price', 'VAT', 'Transfer Fee', 'Rental Rate']
+
+ROWS = [
+    ['A101', '1', '2 bedrooms', '85', '12', '97', '€250,000', '€12,500', '', '€1,200'],
+    ['A102', '1', '1 bedroom', '60', '8', '68', '€180,000', '', '€3,000', '€900'],
+    ['B201', '2', 'Studio', '40', '5', '45', '€120,000', '', '', ''],
+    ['B202', '2', '3 bedrooms', '120', '20', '140', '€400,000', '€20,000', '€1,000', '€2,000'],
+    # No asking price, the tax alone must not show up as a total cost
+    ['C301', '3', '2 bedrooms', '90', '10', '100', '', '€19,000', '', '€1,000'],
+    # No area, the price must not show up as a total cost either
+    ['C302', '3', '2 bedrooms', '90', '10', '', '€300,000', '', '€5,000', '€1,000'],
+    # Malformed values
+    ['C303', '3', '1 bedroom', '50', '5', '55', '€310,000', '1.2.3', '', '€1,000'],
+    ['C304', '3', '1 bedroom', '50', '5', '55', '1.2.3', '€15,000', '', '€1,000'],
+    ['C305', '3', '1 bedroom', '50', '5', '55', '€200,000', '€10,000', '', 'on request'],
+    ['C306', '3', '1 bedroom', '50', '5', '0', '€200,000', '', '', '€800'],
+]
+
+
+class UnitsMatchBaselineTest(unittest.TestCase):
+    def write_csv(self, header, rows):
+        fd, path = tempfile.mkstemp(suffix='.csv')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(header)
+            writer.writerows(rows)
+        return path
+
+    def assert_matches_baseline(self, csv_path):
+        units = csv_parser.extract_units_from_csv(csv_path)
+        expected = baseline_units(csv_path)
+        self.assertEqual(len(units), len(expected))
+
+        for unit, baseline in zip(units, expected):
+            with self.subTest(unit=baseline['unit_id']):
+                self.assertEqual(unit.unit_id, baseline['unit_id'])
+                self.assertEqual(unit.tax_type, baseline['tax_type'])
+                self.assertEqual(unit.tax_value, baseline['tax_value'])
+                self.assertEqual(format_amount(unit.total_cost), baseline['total_cost'])
+                self.assertEqual(format_amount(unit.price_per_m2), baseline['price_per_m2'])
+                self.assertEqual(format_percentage(unit.roi), baseline['roi'])
+
+    def test_calculated_fields(self):
+        self.assert_matches_baseline(self.write_csv(HEADER, ROWS))
+
+    def test_missing_price_and_area_columns(self):
+        dropped = [HEADER.index('Asking Price'), HEADER.index('Total Covered Area')]
+        header = [name for i, name in enumerate(HEADER) if i not in dropped]
+        rows = [[value for i, value in enumerate(row) if i not in dropped] for row in ROWS]
+        self.assert_matches_baseline(self.write_csv(header, rows))
+
+
+if __name__ == '__main__':
+    unittest.main()